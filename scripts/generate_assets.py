@@ -1,6 +1,59 @@
+import hashlib
+import json
 import os
+import shutil
+import subprocess
 from PIL import Image
 
+# Default PNG encoding favours speed while iterating on assets; set
+# ASSETS_RELEASE=1 to spend the extra time on maximum compression
+# (plus an oxipng pass when oxipng is on PATH).
+RELEASE = os.environ.get("ASSETS_RELEASE", "0") == "1"
+
+def save_png(img, path):
+    if RELEASE:
+        img.save(path, "PNG", compress_level=9, optimize=True)
+        # oxipng squeezes release PNGs further than zlib can; use it when it is installed.
+        if shutil.which("oxipng"):
+            subprocess.run(["oxipng", "-o", "max", "--quiet", path], check=False)
+    else:
+        img.save(path, "PNG", compress_level=1, optimize=False)
+
+MANIFEST_FILE = ".asset_cache.json"
+
+def inputs_hash(source_path):
+    # Anything that changes the outputs: the source image, this script and the encoder mode.
+    h = hashlib.sha256()
+    with open(source_path, "rb") as f:
+        h.update(f.read())
+    with open(__file__, "rb") as f:
+        h.update(f.read())
+    h.update(b"release" if RELEASE else b"dev")
+    return h.hexdigest()
+
+def load_manifest(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_manifest(path, manifest):
+    # Write to a temp file and rename so an interrupted run never leaves a truncated manifest.
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+def is_current(manifest, assets_dir, name, key, size):
+    entry = manifest.get(name)
+    return (
+        entry is not None
+        and entry.get("hash") == key
+        and entry.get("size") == list(size)
+        and os.path.exists(os.path.join(assets_dir, name))
+    )
+
 def generate_assets():
     source_path = r"d:\CareTrek-new\assets\ChatGPT Image Nov 6, 2025, 07_19_20 PM.png"
     assets_dir = r"d:\CareTrek-new\assets"
@@ -9,43 +62,62 @@ def generate_assets():
         print(f"Source image not found at {source_path}")
         return
 
+    key = inputs_hash(source_path)
+    manifest_path = os.path.join(assets_dir, MANIFEST_FILE)
+    manifest = load_manifest(manifest_path)
+
     try:
         img = Image.open(source_path)
         print(f"Opened source image: {img.size}")
 
         # 1. icon.png (1024x1024)
         icon_size = (1024, 1024)
-        icon = img.resize(icon_size, Image.Resampling.LANCZOS)
-        icon.save(os.path.join(assets_dir, "icon.png"))
-        print("Generated icon.png")
+        if is_current(manifest, assets_dir, "icon.png", key, icon_size):
+            print("icon.png is up to date")
+        else:
+            icon = img.resize(icon_size, Image.Resampling.LANCZOS)
+            save_png(icon, os.path.join(assets_dir, "icon.png"))
+            manifest["icon.png"] = {"hash": key, "size": list(icon_size)}
+            print("Generated icon.png")
 
         # 2. adaptive-icon.png (1024x1024, but logo should be centered)
         # For adaptive icon, we often want some padding so the circle crop doesn't cut the logo.
         # Let's make the logo 70% of the canvas.
         adaptive_size = (1024, 1024)
-        adaptive_bg = Image.new("RGBA", adaptive_size, (255, 255, 255, 0)) # Transparent bg, or white? App.json says white.
-        # app.json: "backgroundColor": "#ffffff"
-        # So let's make it transparent here and let the background color handle it, OR make it white.
-        # Safest is transparent if the logo is shaped, but if it's a full square logo, just resizing is fine.
-        # Assuming the source is the logo itself.
-        
-        # Let's resize logo to fit within safe area (approx 66% or 720px)
-        logo_target_size = (720, 720)
-        logo_resized = img.resize(logo_target_size, Image.Resampling.LANCZOS)
-        
-        # Center it
-        offset = ((adaptive_size[0] - logo_target_size[0]) // 2, (adaptive_size[1] - logo_target_size[1]) // 2)
-        adaptive_bg.paste(logo_resized, offset)
-        adaptive_bg.save(os.path.join(assets_dir, "adaptive-icon.png"))
-        print("Generated adaptive-icon.png")
+        if is_current(manifest, assets_dir, "adaptive-icon.png", key, adaptive_size):
+            print("adaptive-icon.png is up to date")
+        else:
+            adaptive_bg = Image.new("RGBA", adaptive_size, (255, 255, 255, 0)) # Transparent bg, or white? App.json says white.
+            # app.json: "backgroundColor": "#ffffff"
+            # So let's make it transparent here and let the background color handle it, OR make it white.
+            # Safest is transparent if the logo is shaped, but if it's a full square logo, just resizing is fine.
+            # Assuming the source is the logo itself.
+
+            # Let's resize logo to fit within safe area (approx 66% or 720px)
+            logo_target_size = (720, 720)
+            logo_resized = img.resize(logo_target_size, Image.Resampling.LANCZOS)
+
+            # Center it
+            offset = ((adaptive_size[0] - logo_target_size[0]) // 2, (adaptive_size[1] - logo_target_size[1]) // 2)
+            adaptive_bg.paste(logo_resized, offset)
+            save_png(adaptive_bg, os.path.join(assets_dir, "adaptive-icon.png"))
+            manifest["adaptive-icon.png"] = {"hash": key, "size": list(adaptive_size)}
+            print("Generated adaptive-icon.png")
 
         # 3. splash-icon.png
         # Similar to adaptive, usually just the logo centered.
         # Expo recommends 200px width for splash icon on some densities, but high res is better.
         # We can use the same as adaptive-icon or just the icon itself if it's circular/shaped.
         # Let's use the same logic as adaptive for safety.
-        adaptive_bg.save(os.path.join(assets_dir, "splash-icon.png"))
-        print("Generated splash-icon.png")
+        # The image is identical, so copy the encoded file instead of re-encoding it.
+        if is_current(manifest, assets_dir, "splash-icon.png", key, adaptive_size):
+            print("splash-icon.png is up to date")
+        else:
+            shutil.copyfile(os.path.join(assets_dir, "adaptive-icon.png"), os.path.join(assets_dir, "splash-icon.png"))
+            manifest["splash-icon.png"] = {"hash": key, "size": list(adaptive_size)}
+            print("Generated splash-icon.png")
+
+        save_manifest(manifest_path, manifest)
 
     except Exception as e:
         print(f"Error generating assets: {e}")